@@ -11,26 +11,364 @@ Usage:
 
     # In another terminal, run this monitoring script
     python examples/status_monitoring.py ./training_status.json
+
+Optional dependencies (the script falls back to the standard library without them):
+    msgspec         typed decoding of the status file
+    orjson          faster JSON parsing
+    inotify_simple  wake on file changes instead of polling (Linux only)
 """
 
-import json
+import math
+import os
+import queue
+import threading
 import time
 import sys
-import argparse
-from pathlib import Path
-from datetime import datetime, timezone
+from functools import lru_cache
+
+
+# Fields of the status file written by `--save-status`, as (name, type[, default]). The
+# decoding backend is picked and TrainingStatus built on first use, so `--help` and
+# argument errors don't pay for importing it.
+_STATUS_FIELDS = (
+    ('current_iteration', int),
+    ('total_iterations', int),
+    ('progress_percentage', float),
+    ('elapsed_time_seconds', float),
+    ('estimated_remaining_seconds', float),
+    ('current_splat_count', int),
+    ('export_path', str),
+    ('status', str),
+    ('last_updated', str),
+    ('last_eval_psnr', float | None, None),
+    ('last_eval_ssim', float | None, None),
+    ('current_export_file', str | None, None),
+)
+
+TrainingStatus = None
+_decode = None
+
+
+class StatusDecodeError(ValueError):
+    """The status file isn't valid JSON."""
+
+
+class StatusValidationError(ValueError):
+    """The status file is missing required fields (or, with msgspec, has mistyped ones)."""
+
+
+def _load_decoder():
+    """Build TrainingStatus and its decoder from msgspec, or from orjson/json and a dataclass."""
+    global TrainingStatus
+    try:
+        import msgspec
+    except ImportError:
+        msgspec = None
+
+    if msgspec is not None:
+        TrainingStatus = msgspec.defstruct('TrainingStatus', _STATUS_FIELDS)
+        decoder = msgspec.json.Decoder(TrainingStatus)
+
+        def decode(data):
+            try:
+                return decoder.decode(data)
+            # ValidationError subclasses DecodeError, so it must be caught first
+            except msgspec.ValidationError as e:
+                raise StatusValidationError(str(e)) from e
+            except msgspec.DecodeError as e:
+                raise StatusDecodeError(str(e)) from e
+
+        return decode
+
+    import json
+    from dataclasses import make_dataclass
+
+    try:
+        import orjson
+        json_loads = orjson.loads
+    except ImportError:
+        def json_loads(data):
+            # The stdlib parser doesn't accept memoryviews
+            return json.loads(bytes(data))
+
+    TrainingStatus = make_dataclass('TrainingStatus', _STATUS_FIELDS)
+    required = [field[0] for field in _STATUS_FIELDS if len(field) == 2]
+    optional = [field[0] for field in _STATUS_FIELDS if len(field) == 3]
+
+    def decode(data):
+        try:
+            raw = json_loads(data)
+            # Unknown fields are ignored, as msgspec does
+            values = {name: raw[name] for name in required}
+        except json.JSONDecodeError as e:
+            raise StatusDecodeError(str(e)) from e
+        except KeyError as e:
+            raise StatusValidationError(f"Object missing required field {e}") from e
+        values.update((name, raw.get(name)) for name in optional)
+        return TrainingStatus(**values)
+
+    return decode
+
+
+def decode_status(data):
+    """Decode the status file into a TrainingStatus, ignoring unknown fields."""
+    global _decode
+    if _decode is None:
+        _decode = _load_decoder()
+    return _decode(data)
+
+
+_STATUS_LINE_BASE = (
+    "[{timestamp}] "
+    "Iter {current_iter}/{total_iterations} "
+    "({progress:.1f}%) | "
+    "Elapsed: {elapsed} | "
+    "Remaining: {remaining} | "
+    "Splats: {splat_count:,} | "
+    "Status: {train_status}"
+)
+_STATUS_LINE_EVAL = " | PSNR: {psnr:.2f} | SSIM: {ssim:.3f}"
+_STATUS_LINE_EXPORT = " | Last export: {export_file}"
+
+# Indexed by (has_eval << 1) | has_export
+STATUS_LINE_TEMPLATES = (
+    _STATUS_LINE_BASE,
+    _STATUS_LINE_BASE + _STATUS_LINE_EXPORT,
+    _STATUS_LINE_BASE + _STATUS_LINE_EVAL,
+    _STATUS_LINE_BASE + _STATUS_LINE_EVAL + _STATUS_LINE_EXPORT,
+)
+
+
+# (divisor, suffix), indexed by how many of the 60s / 3600s thresholds are reached
+_DURATION_UNITS = ((1.0, 's'), (60.0, 'm'), (3600.0, 'h'))
 
 
 def format_duration(seconds):
     """Format duration in seconds to human readable format."""
-    if seconds < 60:
-        return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = seconds / 60
-        return f"{minutes:.1f}m"
-    else:
-        hours = seconds / 3600
-        return f"{hours:.1f}h"
+    divisor, suffix = _DURATION_UNITS[(seconds >= 60) + (seconds >= 3600)]
+    return f"{seconds / divisor:.1f}{suffix}"
+
+
+def format_timestamp():
+    """Format the current local wall-clock time as HH:MM:SS."""
+    return _format_timestamp(int(time.time()))
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp(epoch_seconds):
+    return time.strftime('%H:%M:%S', time.localtime(epoch_seconds))
+
+
+def open_watcher(directory):
+    """Watch a directory for rewritten files, or return None to fall back to polling."""
+    try:
+        from inotify_simple import INotify, flags as inotify_flags
+    except ImportError:
+        return None
+    try:
+        watcher = INotify()
+        watcher.add_watch(directory, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+        return watcher
+    except OSError:
+        return None
+
+
+def wait_for_update(watcher, filename, deadline, interval):
+    """
+    Block until `filename` is rewritten or the next tick of a fixed-rate schedule.
+    
+    Ticks are scheduled on the monotonic clock from `deadline`, so time spent reading
+    between waits doesn't make the period drift. Returns the deadline for the next call.
+    """
+    now = time.monotonic()
+    if deadline <= now:
+        deadline += interval
+        if deadline <= now:
+            # Fell behind; restart the schedule from now instead of sleeping
+            return now
+    if watcher is None:
+        time.sleep(deadline - now)
+        return deadline
+    remaining = deadline - now
+    while remaining > 0:
+        # Round up so the read doesn't return just short of the deadline and spin
+        events = watcher.read(timeout=math.ceil(remaining * 1000))
+        if any(event.name == filename for event in events):
+            # Drain writes that queued up meanwhile; the caller only parses the newest contents
+            while watcher.read(timeout=0):
+                pass
+            return deadline
+        remaining = deadline - time.monotonic()
+    return deadline
+
+
+# Smaller than any status file Brush writes
+MIN_STATUS_SIZE = 32
+
+
+def looks_complete(data):
+    """Cheaply check that the data is a whole JSON object rather than a partially written one."""
+    return len(data) >= MIN_STATUS_SIZE and bytes(data[-8:]).rstrip().endswith(b'}')
+
+
+_ITERATION_KEY = b'"current_iteration":'
+
+
+def peek_iteration(data):
+    """
+    Extract current_iteration with a byte scan instead of a full decode.
+    
+    Returns None if the field can't be found this way, so callers fall back to decoding.
+    """
+    # Search the underlying buffer directly; reader views always start at offset 0
+    buf = data.obj if isinstance(data, memoryview) else data
+    length = len(data)
+    start = buf.find(_ITERATION_KEY, 0, length)
+    if start < 0:
+        return None
+    start += len(_ITERATION_KEY)
+    end = buf.find(b',', start, length)
+    if end < 0:
+        end = buf.find(b'}', start, length)
+    try:
+        return int(buf[start:end])
+    except ValueError:
+        return None
+
+
+class StatusFileReader:
+    """
+    Reads the status file into reusable buffers rather than allocating new bytes on every read.
+
+    Brush rewrites the file in place (truncate + write), so it is read with positioned
+    reads rather than mmap: touching a mapped page past the end of a file that was truncated
+    concurrently raises SIGBUS.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+        self._file_id = None
+        self._buffer = bytearray()
+        self._previous = bytearray()
+        self._previous_len = -1
+
+    def read_if_changed(self, st):
+        """Return a view of the file contents, or None if they match the previous read."""
+        # Reopen if the file was replaced rather than rewritten in place
+        if self._fd is None or self._file_id != (st.st_dev, st.st_ino):
+            self._open()
+
+        if len(self._buffer) < st.st_size:
+            self._buffer = bytearray(st.st_size)
+        target = memoryview(self._buffer)[:st.st_size]
+        try:
+            length = self._read_into(target)
+        except OSError:
+            # The handle went stale; reopen and retry once
+            self._open()
+            length = self._read_into(target)
+        view = memoryview(self._buffer)[:length]
+        if length == self._previous_len and view == memoryview(self._previous)[:length]:
+            return None
+
+        self._buffer, self._previous = self._previous, self._buffer
+        self._previous_len = length
+        return view
+
+    def _open(self):
+        self.close()
+        self._fd = os.open(self.path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        file_st = os.fstat(self._fd)
+        self._file_id = (file_st.st_dev, file_st.st_ino)
+
+    def _read_into(self, buffer):
+        # A single positioned read where supported, instead of seek + read
+        if hasattr(os, 'preadv'):
+            return os.preadv(self._fd, [buffer], 0)
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        chunk = os.read(self._fd, len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+_STOP_PRINTING = object()
+
+
+def put_latest(updates, item):
+    """Enqueue without blocking, dropping the oldest entry if the printer has fallen behind."""
+    while True:
+        try:
+            updates.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                updates.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def format_status_line(timestamp, status):
+    """Format a status update, picking the template for the optional fields present."""
+    has_eval = status.last_eval_psnr is not None
+    has_export = bool(status.current_export_file)
+    template = STATUS_LINE_TEMPLATES[(has_eval << 1) | has_export]
+    return template.format_map({
+        'timestamp': timestamp,
+        'current_iter': status.current_iteration,
+        'total_iterations': status.total_iterations,
+        'progress': status.progress_percentage,
+        'elapsed': format_duration(status.elapsed_time_seconds),
+        'remaining': format_duration(status.estimated_remaining_seconds),
+        'splat_count': status.current_splat_count,
+        'train_status': status.status,
+        'psnr': status.last_eval_psnr,
+        'ssim': status.last_eval_ssim,
+        'export_file': status.current_export_file,
+    })
+
+
+def format_status_update(status):
+    """Format the lines printed for a status update, including the completion message."""
+    lines = [format_status_line(format_timestamp(), status)]
+    if status.status == 'completed':
+        lines.append("\n✅ Training completed!")
+        if status.current_export_file:
+            lines.append(f"Final output: {status.export_path}/{status.current_export_file}")
+    elif status.status == 'error':
+        lines.append("\n❌ Training failed!")
+    return "\n".join(lines)
+
+
+def print_status_updates(updates, failures, flush_every=8):
+    """
+    Print preformatted messages from the queue until told to stop.
+    
+    Args:
+        updates: Queue fed by monitor_training_progress
+        failures: List the exception is appended to if writing fails, for the monitor to re-raise
+        flush_every: Flush stdout at least this often (messages) while the queue is busy
+    """
+    try:
+        unflushed = 0
+        while True:
+            item = updates.get()
+            if item is _STOP_PRINTING:
+                break
+            
+            sys.stdout.write(item + "\n")
+            unflushed += 1
+            if unflushed >= flush_every or updates.empty():
+                sys.stdout.flush()
+                unflushed = 0
+        sys.stdout.flush()
+    except Exception as e:
+        failures.append(e)
 
 
 def monitor_training_progress(status_file_path, update_interval=1.0):
@@ -41,102 +379,170 @@ def monitor_training_progress(status_file_path, update_interval=1.0):
         status_file_path: Path to the training status JSON file
         update_interval: How often to check for updates (seconds)
     """
-    status_file = Path(status_file_path)
+    # A non-positive interval would make the tick schedule spin without ever sleeping
+    if not update_interval > 0:
+        raise ValueError(f"update_interval must be positive, got {update_interval}")
+    
+    # Work with a plain string path; the loop runs at 1+ Hz for the whole training run
+    status_file = os.fspath(status_file_path)
+    filename = os.path.basename(status_file)
     last_iteration = -1
+    last_mtime = None
+    last_size = None
+    watcher = open_watcher(os.path.dirname(status_file) or '.')
+    reader = StatusFileReader(status_file)
+    
+    # Print from a separate thread so a slow terminal doesn't stall reading the file
+    updates = queue.Queue(maxsize=16)
+    printer_failures = []
+    printer = threading.Thread(target=print_status_updates, args=(updates, printer_failures))
     
     print(f"Monitoring training progress from: {status_file}")
     print("Press Ctrl+C to stop monitoring\n")
+    printer.start()
     
+    deadline = time.monotonic()
     try:
         while True:
+            # Stop once output is gone (e.g. a closed pipe) rather than monitoring unseen
+            if printer_failures:
+                raise printer_failures[0]
+            
             try:
-                if not status_file.exists():
-                    print("Status file not found, waiting for training to start...")
-                    time.sleep(update_interval)
+                # A single stat covers both the existence check and change detection
+                try:
+                    st = os.stat(status_file)
+                except FileNotFoundError:
+                    put_latest(updates, "Status file not found, waiting for training to start...")
+                    deadline = wait_for_update(watcher, filename, deadline, update_interval)
+                    continue
+                
+                # Skip the read entirely if the file hasn't been touched
+                if (st.st_mtime_ns, st.st_size) == (last_mtime, last_size):
+                    deadline = wait_for_update(watcher, filename, deadline, update_interval)
+                    continue
+                last_mtime, last_size = st.st_mtime_ns, st.st_size
+                
+                # Skip the parse if the contents are unchanged
+                data = reader.read_if_changed(st)
+                if data is None:
+                    deadline = wait_for_update(watcher, filename, deadline, update_interval)
+                    continue
+                
+                # Brush truncates and rewrites the file in place, so a read can race the
+                # writer; retry torn reads quietly rather than failing a full parse
+                if not looks_complete(data):
+                    deadline = wait_for_update(watcher, filename, deadline, update_interval)
                     continue
                 
-                with open(status_file, 'r') as f:
-                    status = json.load(f)
+                # Updates are only shown when the iteration changes, so check it before decoding
+                if peek_iteration(data) == last_iteration:
+                    deadline = wait_for_update(watcher, filename, deadline, update_interval)
+                    continue
+                
+                status = decode_status(data)
                 
                 # Only print update if iteration changed
-                current_iter = status['current_iteration']
+                current_iter = status.current_iteration
                 if current_iter != last_iteration:
                     last_iteration = current_iter
-                    
-                    # Format the status update
-                    progress = status['progress_percentage']
-                    elapsed = format_duration(status['elapsed_time_seconds'])
-                    remaining = format_duration(status['estimated_remaining_seconds'])
-                    splat_count = status['current_splat_count']
-                    train_status = status['status']
-                    
-                    # Build status line
-                    status_line = (
-                        f"[{datetime.now().strftime('%H:%M:%S')}] "
-                        f"Iter {current_iter}/{status['total_iterations']} "
-                        f"({progress:.1f}%) | "
-                        f"Elapsed: {elapsed} | "
-                        f"Remaining: {remaining} | "
-                        f"Splats: {splat_count:,} | "
-                        f"Status: {train_status}"
-                    )
-                    
-                    # Add evaluation metrics if available
-                    if status.get('last_eval_psnr') is not None:
-                        psnr = status['last_eval_psnr']
-                        ssim = status['last_eval_ssim']
-                        status_line += f" | PSNR: {psnr:.2f} | SSIM: {ssim:.3f}"
-                    
-                    # Add export info if available
-                    if status.get('current_export_file'):
-                        export_file = status['current_export_file']
-                        status_line += f" | Last export: {export_file}"
-                    
-                    print(status_line)
+                    # Formatted here rather than in the printer so errors surface in this thread
+                    put_latest(updates, format_status_update(status))
                     
                     # Check if training is completed
-                    if train_status == 'completed':
-                        print(f"\n✅ Training completed!")
-                        if status.get('current_export_file'):
-                            print(f"Final output: {status['export_path']}/{status['current_export_file']}")
-                        break
-                    elif train_status == 'error':
-                        print(f"\n❌ Training failed!")
+                    if status.status in ('completed', 'error'):
                         break
                         
-            except json.JSONDecodeError:
-                print("Status file corrupted, retrying...")
+            except StatusValidationError as e:
+                put_latest(updates, f"Invalid status file: {e}")
+            except StatusDecodeError:
+                put_latest(updates, "Status file corrupted, retrying...")
             except FileNotFoundError:
-                print("Status file disappeared, waiting...")
-            except KeyError as e:
-                print(f"Missing key in status file: {e}")
+                put_latest(updates, "Status file disappeared, waiting...")
             
-            time.sleep(update_interval)
+            deadline = wait_for_update(watcher, filename, deadline, update_interval)
             
     except KeyboardInterrupt:
-        print("\n\nMonitoring stopped by user.")
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Monitor Brush training progress",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__
-    )
-    parser.add_argument(
-        'status_file',
-        help='Path to the training status JSON file'
-    )
-    parser.add_argument(
-        '--interval',
-        type=float,
-        default=1.0,
-        help='Update interval in seconds (default: 1.0)'
-    )
+        put_latest(updates, "\n\nMonitoring stopped by user.")
+    finally:
+        put_latest(updates, _STOP_PRINTING)
+        printer.join()
+        reader.close()
+        if watcher is not None:
+            watcher.close()
+    
+    # Writes that failed after the loop ended (e.g. the completion message)
+    if printer_failures:
+        raise printer_failures[0]
+
+
+USAGE = "usage: status_monitoring.py [-h] [--interval INTERVAL] status_file"
+
+HELP = f"""{USAGE}
+
+Monitor Brush training progress
+
+positional arguments:
+  status_file          Path to the training status JSON file
+
+options:
+  -h, --help           show this help message and exit
+  --interval INTERVAL  Update interval in seconds (default: 1.0)
+"""
+
+
+def usage_error(message):
+    print(f"{USAGE}\nstatus_monitoring.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def main(argv=None):
+    # Parsed by hand to keep startup light; the optional backends are imported lazily too
+    args = sys.argv[1:] if argv is None else argv
+    positional = []
+    unrecognized = []
+    interval = 1.0
+    remaining = iter(args)
+    for arg in remaining:
+        if arg == '--':
+            # Everything after `--` is positional
+            positional.extend(remaining)
+            break
+        if arg in ('-h', '--help'):
+            print(HELP + __doc__)
+            return
+        if arg == '--interval':
+            value = next(remaining, None)
+            if value is None:
+                usage_error("argument --interval: expected one argument")
+        elif arg.startswith('--interval='):
+            value = arg.partition('=')[2]
+        elif arg.startswith('-') and arg != '-':
+            unrecognized.append(arg)
+            continue
+        else:
+            positional.append(arg)
+            continue
+        try:
+            interval = float(value)
+        except ValueError:
+            usage_error(f"argument --interval: invalid float value: '{value}'")
+        if not interval > 0:
+            usage_error("argument --interval: must be positive")
     
-    args = parser.parse_args()
+    if unrecognized:
+        usage_error(f"unrecognized arguments: {' '.join(unrecognized)}")
+    if len(positional) != 1:
+        usage_error("expected exactly one status_file argument")
     
-    monitor_training_progress(args.status_file, args.interval)
+    try:
+        monitor_training_progress(positional[0], interval)
+    except BrokenPipeError:
+        # Stdout was closed early (e.g. piped into `head`). Point it at devnull so the
+        # interpreter's final flush doesn't fail too, and exit like a plain print() would.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -4,14 +4,56 @@ Simple test script to verify the status monitoring feature works.
 This creates a minimal test to check if the status file is created and contains expected fields.
 """
 
+import io
 import json
+import threading
 import time
 import tempfile
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 
+REPO_ROOT = Path(__file__).resolve().parent
+
+# Share the status schema with the monitoring example
+sys.path.insert(0, str(REPO_ROOT / 'examples'))
+from status_monitoring import StatusValidationError, decode_status
+
+try:
+    import orjson
+
+    def dumps_indented(obj):
+        # orjson keeps its fast encoder with indentation, unlike json.dumps(indent=...)
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode()
+
+
+# Generous enough for a cold release build; an up-to-date tree finishes in seconds
+BUILD_TIMEOUT = 900
+
+
+@lru_cache(maxsize=None)
+def brush_binary():
+    """Build the release binary once and return its path, so tests skip `cargo run`."""
+    # Take the path from cargo itself so CARGO_TARGET_DIR and build.target-dir are respected
+    result = subprocess.run(
+        ['cargo', 'build', '--release', '--quiet', '--message-format=json-render-diagnostics'],
+        cwd=REPO_ROOT, check=True, timeout=BUILD_TIMEOUT, stdout=subprocess.PIPE, text=True
+    )
+    for line in result.stdout.splitlines():
+        message = json.loads(line)
+        if (message.get('reason') == 'compiler-artifact'
+                and message.get('executable')
+                and message['target']['name'] == 'brush_app'):
+            return Path(message['executable'])
+    raise RuntimeError("cargo build did not report a brush_app executable")
+
+
 def test_status_file_creation():
     """Test that the status file is created with the correct structure."""
     
@@ -27,7 +69,7 @@ def test_status_file_creation():
         try:
             # Test that the new CLI options are accepted
             result = subprocess.run([
-                'cargo', 'run', '--release', '--',
+                brush_binary(),
                 '--help'
             ], capture_output=True, text=True, timeout=30)
             
@@ -43,8 +85,8 @@ def test_status_file_creation():
                 print(f"❌ Failed to get help: {result.stderr}")
                 return False
                 
-        except subprocess.TimeoutExpired:
-            print("❌ Command timed out")
+        except subprocess.TimeoutExpired as e:
+            print(f"❌ Command timed out: {' '.join(map(str, e.cmd))}")
             return False
         except Exception as e:
             print(f"❌ Error running command: {e}")
@@ -70,25 +112,17 @@ def test_status_file_structure():
         "last_updated": "2025-06-28T09:34:56Z"
     }
     
-    # Test that we can serialize and deserialize the structure
+    # Decoding into TrainingStatus checks required fields (and their types with msgspec)
     try:
-        json_str = json.dumps(sample_status, indent=2)
-        parsed = json.loads(json_str)
-        
-        # Check that all expected fields are present
-        expected_fields = [
-            "current_iteration", "total_iterations", "progress_percentage",
-            "elapsed_time_seconds", "estimated_remaining_seconds", 
-            "current_splat_count", "export_path", "status", "last_updated"
-        ]
-        
-        for field in expected_fields:
-            if field not in parsed:
-                print(f"❌ Missing expected field: {field}")
-                return False
+        json_bytes = dumps_indented(sample_status)
+        try:
+            decode_status(json_bytes)
+        except StatusValidationError as e:
+            print(f"❌ Invalid status file structure: {e}")
+            return False
         
         print("✅ Status file structure is valid")
-        print(f"Sample status file:\n{json_str}")
+        print(f"Sample status file:\n{json_bytes.decode()}")
         return True
         
     except Exception as e:
@@ -96,6 +130,30 @@ def test_status_file_structure():
         return False
 
 
+class ThreadStdout:
+    """Routes writes from registered threads into their own buffers so concurrent test output stays grouped."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffers = {}
+
+    def write(self, text):
+        return self.buffers.get(threading.get_ident(), self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def run_captured(test_func, stdout):
+    """Run a test, returning its result and everything it printed."""
+    buffer = io.StringIO()
+    stdout.buffers[threading.get_ident()] = buffer
+    try:
+        return test_func(), buffer.getvalue()
+    finally:
+        del stdout.buffers[threading.get_ident()]
+
+
 def main():
     """Run all tests."""
     print("Testing AVR Brush Status Monitoring Feature")
@@ -109,11 +167,23 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
+    # The tests are independent, so overlap the cargo build with the rest
+    stdout = ThreadStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            futures = [executor.submit(run_captured, test_func, stdout) for _, test_func in tests]
+            results = [future.result() for future in futures]
+    finally:
+        sys.stdout = stdout.stream
+    
+    # Report in the original order
+    for (test_name, _), (result, output) in zip(tests, results):
         print(f"\nRunning: {test_name}")
         print("-" * 30)
+        print(output, end="")
         
-        if test_func():
+        if result:
             passed += 1
         else:
             print(f"❌ {test_name} failed")